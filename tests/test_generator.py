@@ -3,9 +3,13 @@ from pathlib import Path
 
 from click.testing import CliRunner
 from xsdata.cli import cli
+from xsdata.codegen.models import Restrictions
 from xsdata.models.config import GeneratorConfig
+from xsdata.utils.testing import AttrFactory
+from xsdata.utils.testing import ClassFactory
 from xsdata.utils.testing import FactoryTestCase
 
+from xsdata_pydantic.generator import PydanticFilters
 from xsdata_pydantic.generator import PydanticGenerator
 
 
@@ -36,3 +40,62 @@ class PydanticGeneratorTests(FactoryTestCase):
         )
 
         self.assertIsNone(result.exception)
+
+
+class PydanticFiltersTests(FactoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.filters = PydanticFilters(GeneratorConfig())
+
+    def test_format_arguments(self):
+        data = {"default": None, "metadata": {"type": "Element"}}
+        expected = (
+            "\n"
+            "        default=None,\n"
+            "        metadata={\n"
+            '            "type": "Element",\n'
+            "        }\n"
+            "    "
+        )
+
+        self.assertEqual(expected, self.filters.format_arguments(data, 4))
+        self.assertEqual(expected, self.filters.format_arguments(dict(data), 4))
+        self.assertEqual(1, len(self.filters.arguments_cache))
+
+        self.filters.format_arguments(data, 8)
+        self.filters.format_arguments({"default": "None"}, 4)
+        self.assertEqual(3, len(self.filters.arguments_cache))
+
+    def test_build_import_patterns(self):
+        patterns = PydanticFilters.build_import_patterns()
+
+        self.assertEqual(sorted(patterns), list(patterns))
+        self.assertEqual({}, patterns["dataclasses"])
+        self.assertIn("BaseModel", patterns["pydantic"])
+        self.assertIs(patterns, PydanticFilters.build_import_patterns())
+
+    def test_field_definition(self):
+        obj = ClassFactory.create()
+        attr = AttrFactory.element(name="a", fixed=True, default=1)
+        self.assertEqual(
+            "field(\n"
+            "        const=True,\n"
+            "        default=1,\n"
+            "        metadata={\n"
+            '            "type": "Element",\n'
+            "        }\n"
+            "    )",
+            self.filters.field_definition(obj, attr, None),
+        )
+
+        attr = AttrFactory.element(name="b", restrictions=Restrictions(max_occurs=0))
+        self.assertEqual(
+            "field(\n"
+            "        exclude=True,\n"
+            "        default=None,\n"
+            "        metadata={\n"
+            '            "type": "Ignore",\n'
+            "        }\n"
+            "    )",
+            self.filters.field_definition(obj, attr, None),
+        )
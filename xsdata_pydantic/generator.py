@@ -1,6 +1,8 @@
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from xsdata.codegen.models import Class, Attr
 from xsdata.formats.dataclass.filters import Filters
@@ -20,10 +22,13 @@ class PydanticGenerator(DataclassGenerator):
 
 
 class PydanticFilters(Filters):
+    _import_patterns: Optional[Dict[str, Dict]] = None
+
     def __init__(self, config: GeneratorConfig):
         config.output.format.kw_only = True
         super().__init__(config)
         self.default_class_annotation = None
+        self.arguments_cache: Dict[Tuple, str] = {}
 
     def post_meta_hook(self, obj: Class) -> Optional[str]:
         return "model_config = ConfigDict(defer_build=True)"
@@ -42,18 +47,50 @@ class PydanticFilters(Filters):
         parent_namespace: Optional[str],
     ) -> str:
         """Return the field definition with any extra metadata."""
+        ns_map = obj.ns_map
+        default_value = self.field_default_value(attr, ns_map)
+        metadata = self.field_metadata(obj, attr, parent_namespace)
 
-        result = super().field_definition(obj, attr, parent_namespace)
-
+        kwargs: Dict[str, Any] = {}
         if attr.is_prohibited:
-            result = result.replace("init=False", "exclude=True, default=None")
+            kwargs["exclude"] = True
+            kwargs[self.DEFAULT_KEY] = None
         elif attr.fixed:
-            result = result.replace("init=False", "const=True")
+            kwargs["const"] = True
+
+        if default_value is not False and not attr.is_prohibited:
+            key = self.FACTORY_KEY if attr.is_factory else self.DEFAULT_KEY
+            kwargs[key] = default_value
+
+        if metadata:
+            kwargs["metadata"] = metadata
+
+        return f"field({self.format_arguments(kwargs, 4)})"
+
+    def format_arguments(self, data: Dict, indent: int = 0) -> str:
+        """Return a pretty keyword arguments representation.
+
+        Fields across a schema often share the exact same arguments,
+        the result is cached by the indent and the values reprs.
+        """
+        key = (indent, tuple((name, repr(value)) for name, value in data.items()))
+        result = self.arguments_cache.get(key)
+        if result is None:
+            result = super().format_arguments(data, indent)
+            self.arguments_cache[key] = result
 
         return result
 
     @classmethod
     def build_import_patterns(cls) -> Dict[str, Dict]:
+        """Build import search patterns, computed once per class.
+
+        The returned dictionary is shared, treat it as read-only.
+        """
+        cached = cls.__dict__.get("_import_patterns")
+        if cached is not None:
+            return cached
+
         patterns = super().build_import_patterns()
         patterns.update(
             {
@@ -67,4 +104,5 @@ class PydanticFilters(Filters):
             }
         )
 
-        return {key: patterns[key] for key in sorted(patterns)}
+        cls._import_patterns = dict(sorted(patterns.items()))
+        return cls._import_patterns